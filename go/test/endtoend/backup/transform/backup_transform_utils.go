@@ -17,22 +17,29 @@ limitations under the License.
 package transform
 
 import (
+	"bytes"
 	"encoding/json"
 	"flag"
 	"fmt"
+	"io"
 	"io/ioutil"
 	"os"
 	"os/exec"
 	"path"
+	"strconv"
+	"sync"
 	"testing"
 	"time"
 
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 
+	"vitess.io/vitess/go/mysql"
+	"vitess.io/vitess/go/sqltypes"
 	"vitess.io/vitess/go/test/endtoend/cluster"
 	"vitess.io/vitess/go/test/endtoend/sharding/initialsharding"
 	"vitess.io/vitess/go/vt/log"
+	"vitess.io/vitess/go/vt/mysqlctl"
 )
 
 // test main part of the testcase
@@ -60,6 +67,18 @@ var (
 		"-serving_state_grace_period", "1s"}
 )
 
+// backupCommonArgs are the vttablet flags shared by every tablet restarted
+// from the file backup storage, built once the cluster is created.
+var backupCommonArgs []string
+
+// backupTabletArgs returns backupCommonArgs followed by extraArgs, in a
+// slice allocated at its final size.
+func backupTabletArgs(extraArgs ...string) []string {
+	args := make([]string, 0, len(backupCommonArgs)+len(extraArgs))
+	args = append(args, backupCommonArgs...)
+	return append(args, extraArgs...)
+}
+
 // TestMainSetup sets up the basic test cluster
 func TestMainSetup(m *testing.M, useMysqlctld bool) {
 	defer cluster.PanicHandler(nil)
@@ -68,6 +87,7 @@ func TestMainSetup(m *testing.M, useMysqlctld bool) {
 	exitCode, err := func() (int, error) {
 		localCluster = cluster.NewCluster(cell, hostname)
 		defer localCluster.Teardown()
+		defer closeTabletConns()
 
 		// Start topo server
 		err := localCluster.StartTopo()
@@ -89,11 +109,15 @@ func TestMainSetup(m *testing.M, useMysqlctld bool) {
 		shard := &localCluster.Keyspaces[0].Shards[0]
 		// changing password for mysql user
 		dbCredentialFile = initialsharding.WriteDbCredentialToTmp(localCluster.TmpDirectory)
-		initDb, _ := ioutil.ReadFile(path.Join(os.Getenv("VTROOT"), "/config/init_db.sql"))
-		sql := string(initDb)
-		newInitDBFile = path.Join(localCluster.TmpDirectory, "init_db_with_passwords.sql")
-		sql = sql + initialsharding.GetPasswordUpdateSQL(localCluster)
-		ioutil.WriteFile(newInitDBFile, []byte(sql), 0666)
+		backupCommonArgs = []string{
+			"-db-credentials-file", dbCredentialFile,
+			"-restore_from_backup",
+			"-backup_storage_implementation", "file",
+			"-file_backup_storage_root", localCluster.VtctldProcess.FileBackupStorageRoot}
+		newInitDBFile, err = writeInitDBFile(localCluster.TmpDirectory)
+		if err != nil {
+			return 1, err
+		}
 
 		extraArgs := []string{"-db-credentials-file", dbCredentialFile}
 		commonTabletArg = append(commonTabletArg, "-db-credentials-file", dbCredentialFile)
@@ -114,10 +138,6 @@ func TestMainSetup(m *testing.M, useMysqlctld bool) {
 				tablet.MysqlctldProcess.InitDBFile = newInitDBFile
 				tablet.MysqlctldProcess.ExtraArgs = extraArgs
 				tablet.MysqlctldProcess.Password = tablet.VttabletProcess.DbPassword
-				err := tablet.MysqlctldProcess.Start()
-				if err != nil {
-					return 1, err
-				}
 
 				shard.Vttablets = append(shard.Vttablets, tablet)
 				continue
@@ -134,6 +154,12 @@ func TestMainSetup(m *testing.M, useMysqlctld bool) {
 
 			shard.Vttablets = append(shard.Vttablets, tablet)
 		}
+		if useMysqlctld {
+			// mysqlctld blocks until mysqld is healthy, so boot all of them concurrently
+			if err := forEachTablet(shard.Vttablets, startMysql); err != nil {
+				return 1, err
+			}
+		}
 		for _, proc := range mysqlProcs {
 			if err := proc.Wait(); err != nil {
 				return 1, err
@@ -151,14 +177,14 @@ func TestMainSetup(m *testing.M, useMysqlctld bool) {
 			}
 		}
 
-		// create database for master and replica
-		for _, tablet := range []cluster.Vttablet{*master, *replica1} {
+		// create database for master and replica, and start both vttablets concurrently
+		if err := forEachTablet([]*cluster.Vttablet{master, replica1}, func(tablet *cluster.Vttablet) error {
 			if err := tablet.VttabletProcess.CreateDB(keyspaceName); err != nil {
-				return 1, err
-			}
-			if err := tablet.VttabletProcess.Setup(); err != nil {
-				return 1, err
+				return err
 			}
+			return tablet.VttabletProcess.Setup()
+		}); err != nil {
+			return 1, err
 		}
 
 		// initialize master and start replication
@@ -177,6 +203,34 @@ func TestMainSetup(m *testing.M, useMysqlctld bool) {
 
 }
 
+// initDBSQL caches the contents of config/init_db.sql, so that
+// repeated setups in the same process don't read it again. It is kept
+// as the bytes read from disk, never converted to a string.
+var initDBSQL []byte
+
+// writeInitDBFile writes init_db.sql with the password updates appended
+// to tmpDir and returns its path. The file is not rewritten if it
+// already has the expected content.
+func writeInitDBFile(tmpDir string) (string, error) {
+	if initDBSQL == nil {
+		initDb, err := ioutil.ReadFile(path.Join(os.Getenv("VTROOT"), "/config/init_db.sql"))
+		if err != nil {
+			return "", err
+		}
+		initDBSQL = initDb
+	}
+	pwdSQL := initialsharding.GetPasswordUpdateSQL(localCluster)
+	// assemble the file in one exactly sized buffer, written with a single call
+	sql := make([]byte, 0, len(initDBSQL)+len(pwdSQL))
+	sql = append(sql, initDBSQL...)
+	sql = append(sql, pwdSQL...)
+	fileName := path.Join(tmpDir, "init_db_with_passwords.sql")
+	if existing, err := ioutil.ReadFile(fileName); err == nil && bytes.Equal(existing, sql) {
+		return fileName, nil
+	}
+	return fileName, ioutil.WriteFile(fileName, sql, 0666)
+}
+
 // create query for test table creation
 var vtInsertTest = `create table vt_insert_test (
 	id bigint auto_increment,
@@ -192,13 +246,9 @@ func TestBackupTransformImpl(t *testing.T) {
 
 	// restart the replica with transform hook parameter
 	replica1.VttabletProcess.TearDown()
-	replica1.VttabletProcess.ExtraArgs = []string{
-		"-db-credentials-file", dbCredentialFile,
+	replica1.VttabletProcess.ExtraArgs = backupTabletArgs(
 		"-backup_storage_hook", "test_backup_transform",
-		"-backup_storage_compress=false",
-		"-restore_from_backup",
-		"-backup_storage_implementation", "file",
-		"-file_backup_storage_root", localCluster.VtctldProcess.FileBackupStorageRoot}
+		"-backup_storage_compress=false")
 	replica1.VttabletProcess.ServingStatus = "SERVING"
 	err := replica1.VttabletProcess.Setup()
 	require.Nil(t, err)
@@ -208,7 +258,7 @@ func TestBackupTransformImpl(t *testing.T) {
 	require.Nil(t, err)
 
 	// insert data in master
-	_, err = master.VttabletProcess.QueryTablet("insert into vt_insert_test (msg) values ('test2')", keyspaceName, true)
+	_, err = queryTablet(master, "insert into vt_insert_test (msg) values ('test2')")
 	require.Nil(t, err)
 
 	// validate backup_list, expecting 1 backup available
@@ -225,28 +275,13 @@ func TestBackupTransformImpl(t *testing.T) {
 	// as it is read from the MANIFEST.
 	// clear replica2
 
-	if replica2.MysqlctlProcess.TabletUID > 0 {
-		replica2.MysqlctlProcess.Stop()
-		os.RemoveAll(replica2.VttabletProcess.Directory)
-		// start replica2 from backup
-		err = replica2.MysqlctlProcess.Start()
-		require.Nil(t, err)
-	} else {
-		replica2.MysqlctldProcess.Stop()
-		os.RemoveAll(replica2.VttabletProcess.Directory)
-		// start replica2 from backup
-		err = replica2.MysqlctldProcess.Start()
-		require.Nil(t, err)
-	}
+	err = resetTabletDirs(replica2)
+	require.Nil(t, err)
 
 	err = localCluster.VtctlclientProcess.InitTablet(replica2, cell, keyspaceName, hostname, shardName)
 	require.Nil(t, err)
 	replica2.VttabletProcess.CreateDB(keyspaceName)
-	replica2.VttabletProcess.ExtraArgs = []string{
-		"-db-credentials-file", dbCredentialFile,
-		"-restore_from_backup",
-		"-backup_storage_implementation", "file",
-		"-file_backup_storage_root", localCluster.VtctldProcess.FileBackupStorageRoot}
+	replica2.VttabletProcess.ExtraArgs = backupTabletArgs()
 	replica2.VttabletProcess.ServingStatus = ""
 	err = replica2.VttabletProcess.Setup()
 	require.Nil(t, err)
@@ -277,12 +312,7 @@ func TestBackupTransformErrorImpl(t *testing.T) {
 	err := replica1.VttabletProcess.TearDown()
 	require.Nil(t, err)
 
-	replica1.VttabletProcess.ExtraArgs = []string{
-		"-db-credentials-file", dbCredentialFile,
-		"-backup_storage_hook", "test_backup_error",
-		"-restore_from_backup",
-		"-backup_storage_implementation", "file",
-		"-file_backup_storage_root", localCluster.VtctldProcess.FileBackupStorageRoot}
+	replica1.VttabletProcess.ExtraArgs = backupTabletArgs("-backup_storage_hook", "test_backup_error")
 	replica1.VttabletProcess.ServingStatus = "SERVING"
 	err = replica1.VttabletProcess.Setup()
 	require.Nil(t, err)
@@ -296,6 +326,87 @@ func TestBackupTransformErrorImpl(t *testing.T) {
 	localCluster.VerifyBackupCount(t, shardKsName, 0)
 }
 
+// resetTabletDirs stops mysql on the given tablets, removes their
+// directories and starts mysql again. Each step runs on all the tablets
+// concurrently before moving to the next one.
+func resetTabletDirs(tablets ...*cluster.Vttablet) error {
+	// mysqld may already be down, stop errors are not fatal
+	_ = forEachTablet(tablets, stopMysql)
+	if err := forEachTablet(tablets, func(tablet *cluster.Vttablet) error {
+		return removeDir(tablet.VttabletProcess.Directory)
+	}); err != nil {
+		return err
+	}
+	return forEachTablet(tablets, startMysql)
+}
+
+// removeDir removes dir and everything under it. The tablet directory holds
+// a few large subtrees (data, innodb, logs), which are removed concurrently.
+func removeDir(dir string) error {
+	entries, err := ioutil.ReadDir(dir)
+	if err != nil {
+		if os.IsNotExist(err) {
+			return nil
+		}
+		return err
+	}
+	errs := make(chan error, len(entries))
+	var wg sync.WaitGroup
+	for _, entry := range entries {
+		wg.Add(1)
+		go func(name string) {
+			defer wg.Done()
+			errs <- os.RemoveAll(path.Join(dir, name))
+		}(entry.Name())
+	}
+	wg.Wait()
+	close(errs)
+	for err := range errs {
+		if err != nil {
+			return err
+		}
+	}
+	return os.RemoveAll(dir)
+}
+
+// forEachTablet calls f concurrently for every tablet and returns the
+// first error encountered, once all calls are done.
+func forEachTablet(tablets []*cluster.Vttablet, f func(*cluster.Vttablet) error) error {
+	errs := make(chan error, len(tablets))
+	var wg sync.WaitGroup
+	for _, tablet := range tablets {
+		wg.Add(1)
+		go func(tablet *cluster.Vttablet) {
+			defer wg.Done()
+			errs <- f(tablet)
+		}(tablet)
+	}
+	wg.Wait()
+	close(errs)
+	for err := range errs {
+		if err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// startMysql starts mysql through whichever of mysqlctl or mysqlctld the tablet uses.
+func startMysql(tablet *cluster.Vttablet) error {
+	if tablet.MysqlctlProcess.TabletUID > 0 {
+		return tablet.MysqlctlProcess.Start()
+	}
+	return tablet.MysqlctldProcess.Start()
+}
+
+// stopMysql stops mysql through whichever of mysqlctl or mysqlctld the tablet uses.
+func stopMysql(tablet *cluster.Vttablet) error {
+	if tablet.MysqlctlProcess.TabletUID > 0 {
+		return tablet.MysqlctlProcess.Stop()
+	}
+	return tablet.MysqlctldProcess.Stop()
+}
+
 // validateManifestFile reads manifest and validates that it
 // has a TransformHook, SkipCompress and FileEntries. It also
 // validates that backup_files available in FileEntries have
@@ -303,37 +414,100 @@ func TestBackupTransformErrorImpl(t *testing.T) {
 func validateManifestFile(t *testing.T, backupLocation string) {
 
 	// reading manifest
-	data, err := ioutil.ReadFile(backupLocation + "/MANIFEST")
+	f, err := os.Open(backupLocation + "/MANIFEST")
 	require.Nilf(t, err, "error while reading MANIFEST %v", err)
-	manifest := make(map[string]interface{})
+	defer f.Close()
+	var manifest struct {
+		TransformHook string
+		SkipCompress  bool
+		FileEntries   []mysqlctl.FileEntry
+	}
 
-	// parsing manifest
-	err = json.Unmarshal(data, &manifest)
+	// parsing manifest, decoded straight from the file
+	err = json.NewDecoder(f).Decode(&manifest)
 	require.Nilf(t, err, "error while parsing MANIFEST %v", err)
 
 	// validate manifest
-	transformHook := manifest["TransformHook"]
-	require.Equalf(t, "test_backup_transform", transformHook, "invalid transformHook in MANIFEST")
-	skipCompress := manifest["SkipCompress"]
-	assert.Equalf(t, skipCompress, true, "invalid value of skipCompress")
-
-	// validate backup files
-	fielEntries := manifest["FileEntries"]
-	fileArr, ok := fielEntries.([]interface{})
-	require.True(t, ok)
-	for i := range fileArr {
-		f, err := os.Open(fmt.Sprintf("%s/%d", backupLocation, i))
-		require.Nilf(t, err, "error while opening backup_file %d: %v", i, err)
-		var fileHeader string
-		_, err = fmt.Fscanln(f, &fileHeader)
-		f.Close()
-
-		require.Nilf(t, err, "error while reading backup_file %d: %v", i, err)
-		require.Equalf(t, "header", fileHeader, "wrong file contents for %d", i)
+	require.Equalf(t, "test_backup_transform", manifest.TransformHook, "invalid transformHook in MANIFEST")
+	assert.Equalf(t, manifest.SkipCompress, true, "invalid value of skipCompress")
+
+	// validate backup files, they are named after their index in FileEntries
+	require.NotNil(t, manifest.FileEntries)
+	// the files are independent, read up to 8 of them at a time
+	errs := make([]error, len(manifest.FileEntries))
+	sem := make(chan struct{}, 8)
+	var wg sync.WaitGroup
+	for i := range manifest.FileEntries {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int) {
+			defer func() {
+				<-sem
+				wg.Done()
+			}()
+			errs[i] = checkBackupFileHeader(path.Join(backupLocation, strconv.Itoa(i)))
+		}(i)
+	}
+	wg.Wait()
+	for i, err := range errs {
+		require.Nilf(t, err, "invalid backup_file %d: %v", i, err)
 	}
 
 }
 
+// backupFileHeader is the first line of every file written by the test_backup_transform hook.
+var backupFileHeader = []byte("header\n")
+
+// checkBackupFileHeader validates that the file starts with the 'header'
+// line written by the test_backup_transform hook. It reads exactly the
+// header length in one call, unlike fmt.Fscanln which reads a byte at a time.
+func checkBackupFileHeader(fileName string) error {
+	f, err := os.Open(fileName)
+	if err != nil {
+		return err
+	}
+	defer f.Close()
+	fileHeader := make([]byte, len(backupFileHeader))
+	if _, err := io.ReadFull(f, fileHeader); err != nil {
+		return err
+	}
+	if !bytes.Equal(fileHeader, backupFileHeader) {
+		return fmt.Errorf("wrong file contents: %q", fileHeader)
+	}
+	return nil
+}
+
+// tabletConns caches one mysql connection per tablet alias for queryTablet.
+var tabletConns = map[string]*mysql.Conn{}
+
+// queryTablet executes query in the keyspace database of the tablet over a
+// cached connection. A connection that fails is dropped and reopened by the
+// next call; the query itself is not retried, as it may have been applied.
+func queryTablet(tablet *cluster.Vttablet, query string) (*sqltypes.Result, error) {
+	conn, ok := tabletConns[tablet.Alias]
+	if !ok {
+		var err error
+		if conn, err = tablet.VttabletProcess.TabletConn(keyspaceName, true); err != nil {
+			return nil, err
+		}
+		tabletConns[tablet.Alias] = conn
+	}
+	qr, err := conn.ExecuteFetch(query, 10000, true)
+	if err != nil && mysql.IsConnErr(err) {
+		conn.Close()
+		delete(tabletConns, tablet.Alias)
+	}
+	return qr, err
+}
+
+// closeTabletConns closes all the connections cached by queryTablet.
+func closeTabletConns() {
+	for alias, conn := range tabletConns {
+		conn.Close()
+		delete(tabletConns, alias)
+	}
+}
+
 // verifyReplicationStatus validates the replication status in tablet.
 func verifyReplicationStatus(t *testing.T, vttablet *cluster.Vttablet, expectedStatus string) {
 	status, err := vttablet.VttabletProcess.GetDBVar("rpl_semi_sync_slave_enabled", keyspaceName)
@@ -346,9 +520,9 @@ func verifyReplicationStatus(t *testing.T, vttablet *cluster.Vttablet, expectedS
 
 // verifyInitialReplication creates schema in master, insert some data to master and verify the same data in replica
 func verifyInitialReplication(t *testing.T) {
-	_, err := master.VttabletProcess.QueryTablet(vtInsertTest, keyspaceName, true)
+	_, err := queryTablet(master, vtInsertTest)
 	require.Nil(t, err)
-	_, err = master.VttabletProcess.QueryTablet("insert into vt_insert_test (msg) values ('test1')", keyspaceName, true)
+	_, err = queryTablet(master, "insert into vt_insert_test (msg) values ('test1')")
 	require.Nil(t, err)
 	cluster.VerifyRowsInTablet(t, replica1, keyspaceName, 1)
 }
@@ -558,6 +558,11 @@ func vtctlBackup(t *testing.T, tabletType string) {
 	cluster.VerifyRowsInTablet(t, replica2, keyspaceName, 2)
 
 	cluster.VerifyLocalMetadata(t, replica2, keyspaceName, shardName, cell)
+
+	// take a second backup from replica2, so that RemoveBackup gets more than one backup name
+	err = localCluster.VtctlclientProcess.ExecuteCommand("Backup", replica2.Alias)
+	require.Nil(t, err)
+	backups = localCluster.VerifyBackupCount(t, shardKsName, 2)
 	verifyAfterRemovingBackupNoBackupShouldBePresent(t, backups)
 
 	err = replica2.VttabletProcess.TearDown()
@@ -599,11 +604,14 @@ func restoreWaitForBackup(t *testing.T, tabletType string) {
 }
 
 func verifyAfterRemovingBackupNoBackupShouldBePresent(t *testing.T, backups []string) {
-	// Remove the backup
-	for _, backup := range backups {
-		err := localCluster.VtctlclientProcess.ExecuteCommand("RemoveBackup", shardKsName, backup)
-		require.Nil(t, err)
-	}
+	// An invalid concurrency should be rejected without removing anything
+	err := localCluster.VtctlclientProcess.ExecuteCommand(append([]string{"RemoveBackup", "-concurrency=0", shardKsName}, backups...)...)
+	require.Error(t, err)
+	localCluster.VerifyBackupCount(t, shardKsName, len(backups))
+
+	// Remove all the backups with a single command
+	err = localCluster.VtctlclientProcess.ExecuteCommand(append([]string{"RemoveBackup", shardKsName}, backups...)...)
+	require.Nil(t, err)
 
 	// Now, there should not be no backup
 	localCluster.VerifyBackupCount(t, shardKsName, 0)
@@ -537,6 +537,7 @@ func (cluster *LocalProcessCluster) Teardown() {
 	}
 
 	var mysqlctlProcessList []*exec.Cmd
+	var wg sync.WaitGroup
 	for _, keyspace := range cluster.Keyspaces {
 		for _, shard := range keyspace.Shards {
 			for _, tablet := range shard.Vttablets {
@@ -548,13 +549,25 @@ func (cluster *LocalProcessCluster) Teardown() {
 					}
 				}
 				if tablet.MysqlctldProcess.TabletUID > 0 {
-					if err := tablet.MysqlctldProcess.Stop(); err != nil {
-						log.Errorf("Error in mysqlctl teardown: %v", err)
-					}
+					// mysqlctld shutdown is synchronous, run them concurrently like the mysqlctl ones
+					wg.Add(1)
+					go func(mysqlctld *MysqlctldProcess) {
+						defer wg.Done()
+						if err := mysqlctld.Stop(); err != nil {
+							log.Errorf("Error in mysqlctl teardown: %v", err)
+						}
+					}(&tablet.MysqlctldProcess)
 				}
 
-				if err := tablet.VttabletProcess.TearDown(); err != nil {
-					log.Errorf("Error in vttablet teardown: %v", err)
+				if tablet.VttabletProcess != nil {
+					// vttablet shutdown waits for the process to exit, no need to do it one tablet at a time
+					wg.Add(1)
+					go func(vttablet *VttabletProcess) {
+						defer wg.Done()
+						if err := vttablet.TearDown(); err != nil {
+							log.Errorf("Error in vttablet teardown: %v", err)
+						}
+					}(tablet.VttabletProcess)
 				}
 			}
 		}
@@ -565,6 +578,7 @@ func (cluster *LocalProcessCluster) Teardown() {
 			log.Errorf("Error in mysqlctl teardown wait: %v", err)
 		}
 	}
+	wg.Wait()
 
 	if err := cluster.VtctldProcess.TearDown(); err != nil {
 		log.Errorf("Error in vtctld teardown: %v", err)
@@ -78,14 +78,38 @@ func GetMasterPosition(t *testing.T, vttablet Vttablet, hostname string) (string
 // this is used to check replication caught up the changes from master
 func VerifyRowsInTabletForTable(t *testing.T, vttablet *Vttablet, ksName string, expectedRows int, tableName string) {
 	timeout := time.Now().Add(10 * time.Second)
+	// poll with an exponential backoff, so replication that catches up quickly is seen
+	// quickly, while slow replication doesn't get queried more than every 500ms
+	delay := 10 * time.Millisecond
+	// poll over a single connection, it is only reopened after a connection error
+	var conn *mysql.Conn
+	defer func() {
+		if conn != nil {
+			conn.Close()
+		}
+	}()
 	for time.Now().Before(timeout) {
 		// ignoring the error check, if the newly created table is not replicated, then there might be error and we should ignore it
 		// but eventually it will catch up and if not caught up in required time, testcase will fail
-		qr, _ := vttablet.VttabletProcess.QueryTablet("select * from "+tableName, ksName, true)
-		if qr != nil && len(qr.Rows) == expectedRows {
-			return
+		if conn == nil {
+			conn, _ = vttablet.VttabletProcess.TabletConn(ksName, true)
+		}
+		if conn != nil {
+			qr, err := conn.ExecuteFetch("select * from "+tableName, 10000, true)
+			if err != nil {
+				// only reconnect if the connection itself broke, e.g. not on a missing table
+				if mysql.IsConnErr(err) {
+					conn.Close()
+					conn = nil
+				}
+			} else if len(qr.Rows) == expectedRows {
+				return
+			}
+		}
+		time.Sleep(delay)
+		if delay = delay * 3 / 2; delay > 500*time.Millisecond {
+			delay = 500 * time.Millisecond
 		}
-		time.Sleep(300 * time.Millisecond)
 	}
 	assert.Fail(t, "expected rows not found.")
 }
@@ -146,9 +170,12 @@ func (cluster LocalProcessCluster) VerifyBackupCount(t *testing.T, shardKsName s
 func (cluster LocalProcessCluster) RemoveAllBackups(t *testing.T, shardKsName string) {
 	backups, err := cluster.ListBackups(shardKsName)
 	require.Nil(t, err)
-	for _, backup := range backups {
-		cluster.VtctlclientProcess.ExecuteCommand("RemoveBackup", shardKsName, backup)
+	if len(backups) == 0 {
+		return
 	}
+	// remove them all with a single vtctl invocation
+	args := append([]string{"RemoveBackup", shardKsName}, backups...)
+	cluster.VtctlclientProcess.ExecuteCommand(args...)
 }
 
 // ResetTabletDirectory transitions back to tablet state (i.e. mysql process restarts with cleaned directory and tablet is off)
@@ -310,11 +310,20 @@ func (vttablet *VttabletProcess) CreateDB(keyspace string) error {
 
 // QueryTablet lets you execute a query in this tablet and get the result
 func (vttablet *VttabletProcess) QueryTablet(query string, keyspace string, useDb bool) (*sqltypes.Result, error) {
+	return executeQuery(vttablet.connParams(keyspace, useDb), query)
+}
+
+// TabletConn opens a connection to the mysqld of this tablet, the caller is responsible for closing it
+func (vttablet *VttabletProcess) TabletConn(keyspace string, useDb bool) (*mysql.Conn, error) {
+	dbParams := vttablet.connParams(keyspace, useDb)
+	return mysql.Connect(context.Background(), &dbParams)
+}
+
+func (vttablet *VttabletProcess) connParams(keyspace string, useDb bool) mysql.ConnParams {
 	if !useDb {
 		keyspace = ""
 	}
-	dbParams := NewConnParams(vttablet.DbPort, vttablet.DbPassword, path.Join(vttablet.Directory, "mysql.sock"), keyspace)
-	return executeQuery(dbParams, query)
+	return NewConnParams(vttablet.DbPort, vttablet.DbPassword, path.Join(vttablet.Directory, "mysql.sock"), keyspace)
 }
 
 // QueryTabletWithDB lets you execute query on a specific DB in this tablet and get the result
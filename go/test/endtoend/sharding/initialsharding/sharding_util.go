@@ -17,11 +17,13 @@ limitations under the License.
 package initialsharding
 
 import (
+	"crypto/sha1"
 	"fmt"
 	"io/ioutil"
 	"os"
 	"os/exec"
 	"path"
+	"sync"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -29,6 +31,8 @@ import (
 
 	"vitess.io/vitess/go/test/endtoend/cluster"
 	"vitess.io/vitess/go/test/endtoend/sharding"
+	"vitess.io/vitess/go/vt/log"
+	"vitess.io/vitess/go/vt/mysqlctl"
 	querypb "vitess.io/vitess/go/vt/proto/query"
 	"vitess.io/vitess/go/vt/proto/topodata"
 )
@@ -668,7 +672,9 @@ FLUSH PRIVILEGES;
 
 }
 
-// WriteDbCredentialToTmp writes json format db credentials to tmp directory
+// WriteDbCredentialToTmp writes json format db credentials to tmp directory.
+// The file is named after a hash of its content, so setups sharing tmpDir
+// reuse the existing file instead of writing it again.
 func WriteDbCredentialToTmp(tmpDir string) string {
 	data := []byte(`{
         "vt_dba": ["VtDbaPass"],
@@ -677,8 +683,31 @@ func WriteDbCredentialToTmp(tmpDir string) string {
         "vt_repl": ["VtReplPass"],
         "vt_filtered": ["VtFilteredPass"]
     	}`)
-	dbCredentialFile = path.Join(tmpDir, "db_credentials.json")
-	ioutil.WriteFile(dbCredentialFile, data, 0666)
+	sum := sha1.Sum(data)
+	dbCredentialFile = path.Join(tmpDir, fmt.Sprintf("db_credentials_%x.json", sum[:4]))
+	if _, err := os.Stat(dbCredentialFile); err == nil {
+		return dbCredentialFile
+	}
+	// write to a temporary file and rename it into place, so a concurrent
+	// setup never reads a partially written file
+	tmpFile, err := ioutil.TempFile(tmpDir, "db_credentials_*.tmp")
+	if err != nil {
+		log.Errorf("Error creating db credentials file in %s: %v", tmpDir, err)
+		return dbCredentialFile
+	}
+	_, err = tmpFile.Write(data)
+	tmpFile.Close()
+	if err == nil {
+		// TempFile creates the file with 0600, keep the mode the file always had
+		err = os.Chmod(tmpFile.Name(), 0666)
+	}
+	if err == nil {
+		err = os.Rename(tmpFile.Name(), dbCredentialFile)
+	}
+	if err != nil {
+		log.Errorf("Error writing db credentials file %s: %v", dbCredentialFile, err)
+		os.Remove(tmpFile.Name())
+	}
 	return dbCredentialFile
 }
 
@@ -704,8 +733,47 @@ func GetPasswordUpdateSQL(localCluster *cluster.LocalProcessCluster) string {
 	return fmt.Sprintf(pwdChangeCmd, pwdCol, pwdCol, pwdCol, pwdCol, pwdCol, pwdCol)
 }
 
+var (
+	passwordFieldMu sync.Mutex
+	// passwordField caches the result of getPasswordField, the mysqld binary doesn't change during a test run
+	passwordField string
+)
+
 // getPasswordField Determines which column is used for user passwords in this MySQL version.
+// The column is derived from mysqld --version, which avoids booting a mysqld just to
+// look at mysql.user. Versions that can't be mapped fall back to probePasswordField.
+// The result is computed once per process.
 func getPasswordField(localCluster *cluster.LocalProcessCluster) (pwdCol string, err error) {
+	passwordFieldMu.Lock()
+	defer passwordFieldMu.Unlock()
+	if passwordField != "" {
+		return passwordField, nil
+	}
+
+	version, err := mysqlctl.GetVersionString()
+	if err != nil {
+		pwdCol, err = probePasswordField(localCluster)
+	} else {
+		flavor, ver, parseErr := mysqlctl.ParseVersionString(version)
+		switch {
+		case parseErr != nil || flavor == mysqlctl.FlavorMariaDB:
+			pwdCol, err = probePasswordField(localCluster)
+		case ver.Major > 5 || (ver.Major == 5 && (ver.Minor > 7 || (ver.Minor == 7 && ver.Patch >= 6))):
+			// the password column was replaced by authentication_string in 5.7.6
+			pwdCol = "authentication_string"
+		default:
+			pwdCol = "password"
+		}
+	}
+	if err != nil {
+		return "", err
+	}
+	passwordField = pwdCol
+	return pwdCol, nil
+}
+
+// probePasswordField determines the password column by starting a mysqld and querying mysql.user.
+func probePasswordField(localCluster *cluster.LocalProcessCluster) (pwdCol string, err error) {
 	tablet := &cluster.Vttablet{
 		Type:            "relpica",
 		TabletUID:       100,
@@ -21,9 +21,12 @@ import (
 	"flag"
 	"fmt"
 	"io"
+	"sync"
 
 	"context"
 
+	"vitess.io/vitess/go/sync2"
+	"vitess.io/vitess/go/vt/concurrency"
 	"vitess.io/vitess/go/vt/logutil"
 	"vitess.io/vitess/go/vt/mysqlctl/backupstorage"
 	topodatapb "vitess.io/vitess/go/vt/proto/topodata"
@@ -45,8 +48,8 @@ func init() {
 	addCommand("Shards", command{
 		"RemoveBackup",
 		commandRemoveBackup,
-		"<keyspace/shard> <backup name>",
-		"Removes a backup for the BackupStorage."})
+		"[-concurrency=8] <keyspace/shard> <backup name> [<backup name> ...]",
+		"Removes one or more backups for the BackupStorage."})
 
 	addCommand("Tablets", command{
 		"Backup",
@@ -199,11 +202,15 @@ func commandListBackups(ctx context.Context, wr *wrangler.Wrangler, subFlags *fl
 }
 
 func commandRemoveBackup(ctx context.Context, wr *wrangler.Wrangler, subFlags *flag.FlagSet, args []string) error {
+	maxConcurrency := subFlags.Int("concurrency", 8, "Specifies the number of backups to remove in parallel")
 	if err := subFlags.Parse(args); err != nil {
 		return err
 	}
-	if subFlags.NArg() != 2 {
-		return fmt.Errorf("action RemoveBackup requires <keyspace/shard> <backup name>")
+	if subFlags.NArg() < 2 {
+		return fmt.Errorf("action RemoveBackup requires <keyspace/shard> <backup name> [<backup name> ...]")
+	}
+	if *maxConcurrency < 1 {
+		return fmt.Errorf("-concurrency must be at least 1, got %d", *maxConcurrency)
 	}
 
 	keyspace, shard, err := topoproto.ParseKeyspaceShard(subFlags.Arg(0))
@@ -211,14 +218,30 @@ func commandRemoveBackup(ctx context.Context, wr *wrangler.Wrangler, subFlags *f
 		return err
 	}
 	bucket := fmt.Sprintf("%v/%v", keyspace, shard)
-	name := subFlags.Arg(1)
 
 	bs, err := backupstorage.GetBackupStorage()
 	if err != nil {
 		return err
 	}
 	defer bs.Close()
-	return bs.RemoveBackup(ctx, bucket, name)
+
+	sema := sync2.NewSemaphore(*maxConcurrency, 0)
+	wg := sync.WaitGroup{}
+	rec := concurrency.AllErrorRecorder{}
+	for _, name := range subFlags.Args()[1:] {
+		wg.Add(1)
+		go func(name string) {
+			defer wg.Done()
+			if !sema.AcquireContext(ctx) {
+				rec.RecordError(fmt.Errorf("backup %v not removed: %v", name, ctx.Err()))
+				return
+			}
+			defer sema.Release()
+			rec.RecordError(bs.RemoveBackup(ctx, bucket, name))
+		}(name)
+	}
+	wg.Wait()
+	return rec.Error()
 }
 
 func commandRestoreFromBackup(ctx context.Context, wr *wrangler.Wrangler, subFlags *flag.FlagSet, args []string) error {